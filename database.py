@@ -5,11 +5,13 @@ MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
 """
 
-from pymongo import MongoClient
-from datetime import datetime, timezone
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
+from redis.asyncio import Redis
+from datetime import date, datetime, timezone
 import os
 from dotenv import load_dotenv
-from typing import Union
+from typing import List, Union
 from pydantic import BaseModel
 
 # Load environment variables from .env file
@@ -21,35 +23,100 @@ db = None
 database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
+# One pooled client per worker process, shared by every request
 if database_url and database_name:
-    _client = MongoClient(database_url)
+    _client = AsyncIOMotorClient(
+        database_url,
+        maxPoolSize=int(os.getenv("DATABASE_MAX_POOL_SIZE", 100)),
+        minPoolSize=int(os.getenv("DATABASE_MIN_POOL_SIZE", 10)),
+        maxIdleTimeMS=60000,
+    )
     db = _client[database_name]
 
-# Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
-    """Insert a single document with timestamp"""
-    if db is None:
-        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+# Optional Redis cache for read-heavy endpoints
+cache = None
+
+redis_url = os.getenv("REDIS_URL")
+
+# Keep timeouts short: a stalled Redis should fall back to Mongo, not hang reads
+redis_timeout = float(os.getenv("REDIS_TIMEOUT", 0.25))
+
+if redis_url:
+    cache = Redis.from_url(redis_url, socket_timeout=redis_timeout, socket_connect_timeout=redis_timeout)
 
-    # Convert Pydantic model to dict if needed
+# Upper bound on documents materialized by a single get_documents call
+MAX_DOCUMENTS = 1000
+
+def _to_document(data: Union[BaseModel, dict], now: datetime) -> dict:
+    """Build the BSON-ready dict for an insert, stamped with created/updated times"""
+    # Convert Pydantic model to dict if needed. The model was already validated
+    # by the caller, so dump it once and insert the fresh dict as-is; only
+    # caller-owned dicts need copying before timestamps are added.
     if isinstance(data, BaseModel):
-        data_dict = data.model_dump()
+        data_dict = data.model_dump(mode="python", by_alias=True, exclude_none=True)
     else:
         data_dict = data.copy()
 
-    data_dict['created_at'] = datetime.now(timezone.utc)
-    data_dict['updated_at'] = datetime.now(timezone.utc)
+    # BSON has no date-only type; store dates as ISO strings, which is also
+    # what the string-valued list filters (e.g. attendance ?date=) match on
+    for key, value in data_dict.items():
+        if type(value) is date:
+            data_dict[key] = value.isoformat()
+
+    data_dict['created_at'] = now
+    data_dict['updated_at'] = now
+    return data_dict
 
-    result = db[collection_name].insert_one(data_dict)
+# Helper functions for common database operations
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
+    """Insert a single document with timestamp"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    result = await db[collection_name].insert_one(_to_document(data, datetime.now(timezone.utc)))
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
-    """Get documents from collection"""
+async def create_documents(collection_name: str, items: List[Union[BaseModel, dict]]):
+    """Insert many documents with timestamps in one unordered batch.
+
+    Returns (inserted_ids, errors). With an unordered insert, documents that
+    did not fail are still written, so on partial failure the ids of those
+    are returned alongside one {index, code, errmsg} entry per failed item.
+    """
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    if not items:
+        return [], []
+
+    now = datetime.now(timezone.utc)
+    docs = [_to_document(item, now) for item in items]
+    try:
+        result = await db[collection_name].insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        write_errors = e.details.get("writeErrors") or []
+        if not write_errors:
+            raise
+        failed = {err["index"] for err in write_errors}
+        # insert_many assigns _id to each document before sending the batch
+        inserted = [str(doc["_id"]) for i, doc in enumerate(docs) if i not in failed]
+        errors = [{"index": err["index"], "code": err.get("code"), "errmsg": err.get("errmsg")} for err in write_errors]
+        return inserted, errors
+    return [str(_id) for _id in result.inserted_ids], []
+
+async def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None, skip: int = 0, projection: List[str] = None):
+    """Get documents from collection (at most MAX_DOCUMENTS unless limit is given)"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
     
-    cursor = db[collection_name].find(filter_dict or {})
-    if limit:
-        cursor = cursor.limit(limit)
-    
-    return list(cursor)
+    limit = limit or MAX_DOCUMENTS
+    # A None filter is passed through as-is; find() treats it as "match all"
+    cursor = db[collection_name].find(filter_dict, projection).skip(skip).limit(limit)
+    return await cursor.to_list(length=limit)
+
+def stream_documents(collection_name: str, filter_dict: dict = None, batch_size: int = 500):
+    """Get an async cursor over a collection, fetched batch_size documents at a time"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    return db[collection_name].find(filter_dict).batch_size(batch_size)
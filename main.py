@@ -1,24 +1,148 @@
+import asyncio
+import hashlib
+import logging
 import os
-from fastapi import FastAPI, HTTPException
+import orjson
+import pydantic_core
+import time
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from fastapi import Body, FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from bson import ObjectId
+from pymongo import ASCENDING
+from pymongo.errors import PyMongoError
 from pydantic import BaseModel
-from typing import Any, Dict, Optional
+from pydantic.version import version_info
+from redis.exceptions import RedisError
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from database import create_document, get_documents, db
+from database import create_document, create_documents, get_documents, stream_documents, db, cache, MAX_DOCUMENTS
 from schemas import (
     Tenant, User, Teacher, Parent, Student, Class, Enrollment, Attendance,
     GradeRecord, Invoice, Payment, Announcement, Notification, Resource,
-    Assignment, Quiz, QuizSubmission, ActivityLog
+    Assignment, Quiz, QuizSubmission, ActivityLog, OBJECT_ID_PATTERN
 )
 
-app = FastAPI(title="EDmin API", version="1.0", description="SaaS-based Student & Education Management Platform")
+# ---------------------------------------------
+# JSON serialization
+# ---------------------------------------------
+
+def _orjson_default(obj: Any) -> Any:
+    # orjson handles datetime natively; Mongo documents also carry ObjectIds
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+class MongoJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+async def _ndjson(cursor: Any) -> AsyncIterator[bytes]:
+    async for doc in cursor:
+        yield _dumps(doc) + b"\n"
+
+# ---------------------------------------------
+# Collection names (lowercase of model class name)
+# ---------------------------------------------
+
+TENANT_COLL = "tenant"
+USER_COLL = "user"
+STUDENT_COLL = "student"
+CLASS_COLL = "class"
+ENROLLMENT_COLL = "enrollment"
+ATTENDANCE_COLL = "attendance"
+GRADE_RECORD_COLL = "graderecord"
+INVOICE_COLL = "invoice"
+PAYMENT_COLL = "payment"
+ANNOUNCEMENT_COLL = "announcement"
+RESOURCE_COLL = "resource"
+ASSIGNMENT_COLL = "assignment"
+QUIZ_COLL = "quiz"
+QUIZ_SUBMISSION_COLL = "quizsubmission"
+ACTIVITY_LOG_COLL = "activitylog"
+
+# ---------------------------------------------
+# Indexes backing the list endpoint filters
+# ---------------------------------------------
+
+# tenant_id leads every index since nearly every query is tenant scoped
+INDEXES = (
+    (USER_COLL, [("tenant_id", ASCENDING)]),
+    (STUDENT_COLL, [("tenant_id", ASCENDING), ("grade_level", ASCENDING)]),
+    (CLASS_COLL, [("tenant_id", ASCENDING)]),
+    (ENROLLMENT_COLL, [("tenant_id", ASCENDING), ("class_id", ASCENDING), ("student_id", ASCENDING)]),
+    (ATTENDANCE_COLL, [("tenant_id", ASCENDING), ("class_id", ASCENDING), ("student_id", ASCENDING), ("date", ASCENDING)]),
+    (GRADE_RECORD_COLL, [("tenant_id", ASCENDING), ("student_id", ASCENDING), ("class_id", ASCENDING), ("term", ASCENDING)]),
+    (INVOICE_COLL, [("tenant_id", ASCENDING), ("student_id", ASCENDING), ("status", ASCENDING)]),
+    (PAYMENT_COLL, [("tenant_id", ASCENDING), ("invoice_id", ASCENDING), ("status", ASCENDING)]),
+    (ANNOUNCEMENT_COLL, [("tenant_id", ASCENDING)]),
+    (RESOURCE_COLL, [("tenant_id", ASCENDING), ("subject", ASCENDING), ("grade_level", ASCENDING)]),
+    (ASSIGNMENT_COLL, [("tenant_id", ASCENDING), ("class_id", ASCENDING)]),
+    (QUIZ_COLL, [("tenant_id", ASCENDING), ("class_id", ASCENDING)]),
+    (QUIZ_SUBMISSION_COLL, [("tenant_id", ASCENDING), ("quiz_id", ASCENDING), ("student_id", ASCENDING)]),
+    (ACTIVITY_LOG_COLL, [("tenant_id", ASCENDING), ("user_id", ASCENDING), ("action", ASCENDING)]),
+)
+
+# ---------------------------------------------
+# Startup
+# ---------------------------------------------
+
+# uvicorn only configures its own loggers, so give this one a handler of its own
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(levelname)s:     %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+def check_pydantic_core() -> None:
+    """Fail fast without the native pydantic-core extension; warn on non-release builds"""
+    core_path = pydantic_core._pydantic_core.__file__ or ""
+    if not core_path.endswith((".so", ".pyd")):
+        raise RuntimeError(f"pydantic-core native extension not loaded: {core_path}")
+    if getattr(pydantic_core._pydantic_core, "build_profile", "release") != "release":
+        logger.warning("pydantic-core is a %s build", pydantic_core._pydantic_core.build_profile)
+    logger.info("Pydantic runtime:\n%s", version_info())
+
+async def ensure_indexes() -> None:
+    """Create INDEXES, logging instead of raising so an unreachable Mongo never blocks startup"""
+    try:
+        for coll, keys in INDEXES:
+            await db[coll].create_index(keys)
+    except PyMongoError as e:
+        logger.warning("Could not create indexes: %s", e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_pydantic_core()
+    # Run in the background: create_index waits out server selection when
+    # Mongo is down, and the app must still come up to report it via /health
+    index_task = asyncio.create_task(ensure_indexes()) if db is not None else None
+    yield
+    if index_task is not None:
+        index_task.cancel()
+    if cache is not None:
+        await cache.aclose()
+
+app = FastAPI(lifespan=lifespan, default_response_class=MongoJSONResponse, title="EDmin API", version="1.0", description="SaaS-based Student & Education Management Platform")
+
+# FRONTEND_URL may list several comma-separated origins. Without it, fall back
+# to any origin, which browsers only honour for requests without credentials.
+_cors_origins = [o.strip() for o in os.getenv("FRONTEND_URL", "").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=_cors_origins or ["*"],
+    allow_credentials=bool(_cors_origins),
+    allow_methods=["GET", "POST"],
+    allow_headers=["authorization", "content-type", "if-none-match"],
+    max_age=86400,
 )
 
 # ---------------------------------------------
@@ -28,8 +152,37 @@ app.add_middleware(
 def read_root():
     return {"message": "EDmin Backend is running"}
 
+# Well under typical probe timeouts, so an unreachable Mongo yields a fast 503
+HEALTH_PING_TIMEOUT = float(os.getenv("HEALTH_PING_TIMEOUT", 1.5))
+
+@app.get("/health")
+async def health():
+    """Cheap probe endpoint: a single ping instead of the /test diagnostics"""
+    if db is None:
+        return {"status": "ok", "database": "not configured"}
+    try:
+        await asyncio.wait_for(db.command("ping"), timeout=HEALTH_PING_TIMEOUT)
+    except asyncio.TimeoutError:
+        return MongoJSONResponse({"status": "error", "database": "ping timed out"}, status_code=503)
+    except Exception as e:
+        return MongoJSONResponse({"status": "error", "database": str(e)[:50]}, status_code=503)
+    return {"status": "ok", "database": "ok"}
+
+# /test lists collections, which is a full round-trip; reuse the result briefly
+COLLECTIONS_CACHE_TTL = 30
+_collections_cache: Tuple[Optional[float], List[str]] = (None, [])
+
+async def list_collections() -> List[str]:
+    global _collections_cache
+    fetched_at, names = _collections_cache
+    if fetched_at is not None and time.monotonic() - fetched_at < COLLECTIONS_CACHE_TTL:
+        return names
+    names = await db.list_collection_names()
+    _collections_cache = (time.monotonic(), names)
+    return names
+
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -45,7 +198,7 @@ def test_database():
             response["database_name"] = db.name if hasattr(db, 'name') else "✅ Connected"
             response["connection_status"] = "Connected"
             try:
-                collections = db.list_collection_names()
+                collections = await list_collections()
                 response["collections"] = collections[:20]
                 response["database"] = "✅ Connected & Working"
             except Exception as e:
@@ -60,11 +213,51 @@ def test_database():
     return response
 
 # ---------------------------------------------
-# Helper to map model to collection name
+# Query parameters shared by list endpoints
+# ---------------------------------------------
+
+# Ids are stringified ObjectIds; reject anything else before it reaches Mongo
+ObjectIdQuery = Annotated[Optional[str], Query(pattern=OBJECT_ID_PATTERN)]
+
+Limit = Annotated[int, Query(ge=1, le=MAX_DOCUMENTS)]
+Skip = Annotated[int, Query(ge=0)]
+Fields = Annotated[Optional[str], Query(description="Comma-separated fields to return")]
+
+def projection(fields: Optional[str]) -> Optional[List[str]]:
+    # Tolerate "a, b" and stray commas; an empty path would be rejected by Mongo
+    if not fields:
+        return None
+    return [f for f in (part.strip() for part in fields.split(",")) if f] or None
+
+# ---------------------------------------------
+# Response cache for low-volatility list endpoints
 # ---------------------------------------------
 
-def collection_name(model_cls: Any) -> str:
-    return model_cls.__name__.lower()
+LIST_CACHE_TTL = int(os.getenv("LIST_CACHE_TTL", 60))
+
+async def cached_documents(coll: str, filt: Optional[Dict[str, Any]], limit: int, skip: int, fields: Optional[str]) -> Response:
+    """Serve serialized documents from Redis, falling back to Mongo on a miss.
+
+    Entries are keyed by collection, filter and page only, so this must not be
+    used for responses that depend on the requesting user. Writes are not
+    invalidated; entries simply expire after LIST_CACHE_TTL seconds.
+    """
+    key = f"edmin:{coll}:{limit}:{skip}:{fields or ''}:".encode() + orjson.dumps(filt)
+    if cache is not None:
+        try:
+            body = await cache.get(key)
+            if body is not None:
+                return Response(body, media_type="application/json")
+        except RedisError:
+            pass
+
+    body = _dumps(await get_documents(coll, filt, limit, skip, projection(fields)))
+    if cache is not None:
+        try:
+            await cache.set(key, body, ex=LIST_CACHE_TTL)
+        except RedisError:
+            pass
+    return Response(body, media_type="application/json")
 
 # ---------------------------------------------
 # Minimal CRUD Endpoints (Create + List) for key entities
@@ -74,246 +267,266 @@ def collection_name(model_cls: Any) -> str:
 class CreateResponse(BaseModel):
     id: str
 
+class BulkCreateResponse(BaseModel):
+    ids: List[str]
+    errors: List[Dict[str, Any]] = []
+
+async def bulk_create(coll: str, payload: List[BaseModel]) -> Any:
+    ids, errors = await create_documents(coll, payload)
+    if errors:
+        # Partial success: report what was written so clients only retry failures
+        return MongoJSONResponse({"ids": ids, "errors": errors}, status_code=207)
+    return {"ids": ids, "errors": []}
+
 @app.post("/tenants", response_model=CreateResponse)
 async def create_tenant(payload: Tenant):
-    _id = create_document(collection_name(Tenant), payload)
+    _id = await create_document(TENANT_COLL, payload)
     return {"id": _id}
 
 @app.get("/tenants")
-async def list_tenants():
-    return get_documents(collection_name(Tenant))
+async def list_tenants(limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    return await cached_documents(TENANT_COLL, None, limit, skip, fields)
 
 @app.post("/users", response_model=CreateResponse)
 async def create_user(payload: User):
-    _id = create_document(collection_name(User), payload)
+    _id = await create_document(USER_COLL, payload)
     return {"id": _id}
 
 @app.get("/users")
-async def list_users(tenant_id: Optional[str] = None):
-    filt: Dict[str, Any] = {"tenant_id": tenant_id} if tenant_id else {}
-    return get_documents(collection_name(User), filt)
+async def list_users(tenant_id: ObjectIdQuery = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Optional[Dict[str, Any]] = {"tenant_id": tenant_id} if tenant_id else None
+    return MongoJSONResponse(await get_documents(USER_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/students", response_model=CreateResponse)
 async def create_student(payload: Student):
-    _id = create_document(collection_name(Student), payload)
+    _id = await create_document(STUDENT_COLL, payload)
     return {"id": _id}
 
 @app.get("/students")
-async def list_students(tenant_id: Optional[str] = None, grade_level: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if grade_level:
-        filt["grade_level"] = grade_level
-    return get_documents(collection_name(Student), filt)
+async def list_students(tenant_id: ObjectIdQuery = None, grade_level: Optional[str] = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("grade_level", grade_level)) if v}
+    return MongoJSONResponse(await get_documents(STUDENT_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/classes", response_model=CreateResponse)
 async def create_class(payload: Class):
-    _id = create_document(collection_name(Class), payload)
+    _id = await create_document(CLASS_COLL, payload)
     return {"id": _id}
 
 @app.get("/classes")
-async def list_classes(tenant_id: Optional[str] = None):
-    filt: Dict[str, Any] = {"tenant_id": tenant_id} if tenant_id else {}
-    return get_documents(collection_name(Class), filt)
+async def list_classes(tenant_id: ObjectIdQuery = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Optional[Dict[str, Any]] = {"tenant_id": tenant_id} if tenant_id else None
+    return await cached_documents(CLASS_COLL, filt, limit, skip, fields)
 
 @app.post("/enrollments", response_model=CreateResponse)
 async def create_enrollment(payload: Enrollment):
-    _id = create_document(collection_name(Enrollment), payload)
+    _id = await create_document(ENROLLMENT_COLL, payload)
     return {"id": _id}
 
 @app.get("/enrollments")
-async def list_enrollments(tenant_id: Optional[str] = None, class_id: Optional[str] = None, student_id: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if class_id:
-        filt["class_id"] = class_id
-    if student_id:
-        filt["student_id"] = student_id
-    return get_documents(collection_name(Enrollment), filt)
+async def list_enrollments(tenant_id: ObjectIdQuery = None, class_id: ObjectIdQuery = None, student_id: ObjectIdQuery = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("class_id", class_id), ("student_id", student_id)) if v}
+    return MongoJSONResponse(await get_documents(ENROLLMENT_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/attendance", response_model=CreateResponse)
 async def mark_attendance(payload: Attendance):
-    _id = create_document(collection_name(Attendance), payload)
+    _id = await create_document(ATTENDANCE_COLL, payload)
     return {"id": _id}
 
+@app.post("/attendance/bulk", response_model=BulkCreateResponse)
+async def mark_attendance_bulk(payload: Annotated[List[Attendance], Body(max_length=MAX_DOCUMENTS)]):
+    return await bulk_create(ATTENDANCE_COLL, payload)
+
 @app.get("/attendance")
-async def list_attendance(tenant_id: Optional[str] = None, class_id: Optional[str] = None, student_id: Optional[str] = None, date: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if class_id:
-        filt["class_id"] = class_id
-    if student_id:
-        filt["student_id"] = student_id
-    if date:
-        filt["date"] = date
-    return get_documents(collection_name(Attendance), filt)
+async def list_attendance(tenant_id: ObjectIdQuery = None, class_id: ObjectIdQuery = None, student_id: ObjectIdQuery = None, date: Optional[str] = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("class_id", class_id), ("student_id", student_id), ("date", date)) if v}
+    return MongoJSONResponse(await get_documents(ATTENDANCE_COLL, filt, limit, skip, projection(fields)))
+
+@app.get("/attendance/stream")
+async def stream_attendance(tenant_id: ObjectIdQuery = None, class_id: ObjectIdQuery = None, student_id: ObjectIdQuery = None, date: Optional[str] = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("class_id", class_id), ("student_id", student_id), ("date", date)) if v}
+    return StreamingResponse(_ndjson(stream_documents(ATTENDANCE_COLL, filt)), media_type="application/x-ndjson")
 
 @app.post("/grades", response_model=CreateResponse)
 async def create_grade(payload: GradeRecord):
-    _id = create_document(collection_name(GradeRecord), payload)
+    _id = await create_document(GRADE_RECORD_COLL, payload)
     return {"id": _id}
 
+@app.post("/grades/bulk", response_model=BulkCreateResponse)
+async def create_grades_bulk(payload: Annotated[List[GradeRecord], Body(max_length=MAX_DOCUMENTS)]):
+    return await bulk_create(GRADE_RECORD_COLL, payload)
+
 @app.get("/grades")
-async def list_grades(tenant_id: Optional[str] = None, student_id: Optional[str] = None, class_id: Optional[str] = None, term: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if student_id:
-        filt["student_id"] = student_id
-    if class_id:
-        filt["class_id"] = class_id
-    if term:
-        filt["term"] = term
-    return get_documents(collection_name(GradeRecord), filt)
+async def list_grades(tenant_id: ObjectIdQuery = None, student_id: ObjectIdQuery = None, class_id: ObjectIdQuery = None, term: Optional[str] = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("student_id", student_id), ("class_id", class_id), ("term", term)) if v}
+    return MongoJSONResponse(await get_documents(GRADE_RECORD_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/invoices", response_model=CreateResponse)
 async def create_invoice(payload: Invoice):
-    _id = create_document(collection_name(Invoice), payload)
+    _id = await create_document(INVOICE_COLL, payload)
     return {"id": _id}
 
 @app.get("/invoices")
-async def list_invoices(tenant_id: Optional[str] = None, student_id: Optional[str] = None, status: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if student_id:
-        filt["student_id"] = student_id
-    if status:
-        filt["status"] = status
-    return get_documents(collection_name(Invoice), filt)
+async def list_invoices(tenant_id: ObjectIdQuery = None, student_id: ObjectIdQuery = None, status: Optional[str] = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("student_id", student_id), ("status", status)) if v}
+    return MongoJSONResponse(await get_documents(INVOICE_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/payments", response_model=CreateResponse)
 async def create_payment(payload: Payment):
-    _id = create_document(collection_name(Payment), payload)
+    _id = await create_document(PAYMENT_COLL, payload)
     return {"id": _id}
 
 @app.get("/payments")
-async def list_payments(tenant_id: Optional[str] = None, invoice_id: Optional[str] = None, status: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if invoice_id:
-        filt["invoice_id"] = invoice_id
-    if status:
-        filt["status"] = status
-    return get_documents(collection_name(Payment), filt)
+async def list_payments(tenant_id: ObjectIdQuery = None, invoice_id: ObjectIdQuery = None, status: Optional[str] = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("invoice_id", invoice_id), ("status", status)) if v}
+    return MongoJSONResponse(await get_documents(PAYMENT_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/announcements", response_model=CreateResponse)
 async def create_announcement(payload: Announcement):
-    _id = create_document(collection_name(Announcement), payload)
+    _id = await create_document(ANNOUNCEMENT_COLL, payload)
     return {"id": _id}
 
 @app.get("/announcements")
-async def list_announcements(tenant_id: Optional[str] = None):
-    filt: Dict[str, Any] = {"tenant_id": tenant_id} if tenant_id else {}
-    return get_documents(collection_name(Announcement), filt)
+async def list_announcements(tenant_id: ObjectIdQuery = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Optional[Dict[str, Any]] = {"tenant_id": tenant_id} if tenant_id else None
+    return await cached_documents(ANNOUNCEMENT_COLL, filt, limit, skip, fields)
 
 @app.post("/resources", response_model=CreateResponse)
 async def create_resource(payload: Resource):
-    _id = create_document(collection_name(Resource), payload)
+    _id = await create_document(RESOURCE_COLL, payload)
     return {"id": _id}
 
 @app.get("/resources")
-async def list_resources(tenant_id: Optional[str] = None, subject: Optional[str] = None, grade_level: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if subject:
-        filt["subject"] = subject
-    if grade_level:
-        filt["grade_level"] = grade_level
-    return get_documents(collection_name(Resource), filt)
+async def list_resources(tenant_id: ObjectIdQuery = None, subject: Optional[str] = None, grade_level: Optional[str] = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("subject", subject), ("grade_level", grade_level)) if v}
+    return await cached_documents(RESOURCE_COLL, filt, limit, skip, fields)
 
 @app.post("/assignments", response_model=CreateResponse)
 async def create_assignment(payload: Assignment):
-    _id = create_document(collection_name(Assignment), payload)
+    _id = await create_document(ASSIGNMENT_COLL, payload)
     return {"id": _id}
 
 @app.get("/assignments")
-async def list_assignments(tenant_id: Optional[str] = None, class_id: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if class_id:
-        filt["class_id"] = class_id
-    return get_documents(collection_name(Assignment), filt)
+async def list_assignments(tenant_id: ObjectIdQuery = None, class_id: ObjectIdQuery = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("class_id", class_id)) if v}
+    return MongoJSONResponse(await get_documents(ASSIGNMENT_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/quizzes", response_model=CreateResponse)
 async def create_quiz(payload: Quiz):
-    _id = create_document(collection_name(Quiz), payload)
+    _id = await create_document(QUIZ_COLL, payload)
     return {"id": _id}
 
 @app.get("/quizzes")
-async def list_quizzes(tenant_id: Optional[str] = None, class_id: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if class_id:
-        filt["class_id"] = class_id
-    return get_documents(collection_name(Quiz), filt)
+async def list_quizzes(tenant_id: ObjectIdQuery = None, class_id: ObjectIdQuery = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("class_id", class_id)) if v}
+    return MongoJSONResponse(await get_documents(QUIZ_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/quiz-submissions", response_model=CreateResponse)
 async def create_quiz_submission(payload: QuizSubmission):
-    _id = create_document(collection_name(QuizSubmission), payload)
+    _id = await create_document(QUIZ_SUBMISSION_COLL, payload)
     return {"id": _id}
 
+@app.post("/quiz-submissions/bulk", response_model=BulkCreateResponse)
+async def create_quiz_submissions_bulk(payload: Annotated[List[QuizSubmission], Body(max_length=MAX_DOCUMENTS)]):
+    return await bulk_create(QUIZ_SUBMISSION_COLL, payload)
+
 @app.get("/quiz-submissions")
-async def list_quiz_submissions(tenant_id: Optional[str] = None, quiz_id: Optional[str] = None, student_id: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if quiz_id:
-        filt["quiz_id"] = quiz_id
-    if student_id:
-        filt["student_id"] = student_id
-    return get_documents(collection_name(QuizSubmission), filt)
+async def list_quiz_submissions(tenant_id: ObjectIdQuery = None, quiz_id: ObjectIdQuery = None, student_id: ObjectIdQuery = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("quiz_id", quiz_id), ("student_id", student_id)) if v}
+    return MongoJSONResponse(await get_documents(QUIZ_SUBMISSION_COLL, filt, limit, skip, projection(fields)))
 
 @app.post("/activity", response_model=CreateResponse)
 async def track_activity(payload: ActivityLog):
-    _id = create_document(collection_name(ActivityLog), payload)
+    _id = await create_document(ACTIVITY_LOG_COLL, payload)
     return {"id": _id}
 
+@app.post("/activity/bulk", response_model=BulkCreateResponse)
+async def track_activity_bulk(payload: Annotated[List[ActivityLog], Body(max_length=MAX_DOCUMENTS)]):
+    return await bulk_create(ACTIVITY_LOG_COLL, payload)
+
 @app.get("/activity")
-async def list_activity(tenant_id: Optional[str] = None, user_id: Optional[str] = None, action: Optional[str] = None):
-    filt: Dict[str, Any] = {}
-    if tenant_id:
-        filt["tenant_id"] = tenant_id
-    if user_id:
-        filt["user_id"] = user_id
-    if action:
-        filt["action"] = action
-    return get_documents(collection_name(ActivityLog), filt)
+async def list_activity(tenant_id: ObjectIdQuery = None, user_id: ObjectIdQuery = None, action: Optional[str] = None, limit: Limit = 100, skip: Skip = 0, fields: Fields = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("user_id", user_id), ("action", action)) if v}
+    return MongoJSONResponse(await get_documents(ACTIVITY_LOG_COLL, filt, limit, skip, projection(fields)))
+
+@app.get("/activity/stream")
+async def stream_activity(tenant_id: ObjectIdQuery = None, user_id: ObjectIdQuery = None, action: Optional[str] = None):
+    filt: Dict[str, Any] = {k: v for k, v in (("tenant_id", tenant_id), ("user_id", user_id), ("action", action)) if v}
+    return StreamingResponse(_ndjson(stream_documents(ACTIVITY_LOG_COLL, filt)), media_type="application/x-ndjson")
 
 # ---------------------------------------------
 # Schema exposure for tooling
 # ---------------------------------------------
+# Schemas never change at runtime, so build and serialize them once at import
+_SCHEMA_DICTS = MappingProxyType({
+    "tenant": Tenant.model_json_schema(),
+    "user": User.model_json_schema(),
+    "teacher": Teacher.model_json_schema(),
+    "parent": Parent.model_json_schema(),
+    "student": Student.model_json_schema(),
+    "class": Class.model_json_schema(),
+    "enrollment": Enrollment.model_json_schema(),
+    "attendance": Attendance.model_json_schema(),
+    "graderecord": GradeRecord.model_json_schema(),
+    "invoice": Invoice.model_json_schema(),
+    "payment": Payment.model_json_schema(),
+    "announcement": Announcement.model_json_schema(),
+    "notification": Notification.model_json_schema(),
+    "resource": Resource.model_json_schema(),
+    "assignment": Assignment.model_json_schema(),
+    "quiz": Quiz.model_json_schema(),
+    "quizsubmission": QuizSubmission.model_json_schema(),
+    "activitylog": ActivityLog.model_json_schema(),
+})
+# orjson cannot serialize a mappingproxy, so dump a plain dict copy (once, at import)
+_SCHEMA_JSON = orjson.dumps(dict(_SCHEMA_DICTS))
+_SCHEMAS = MappingProxyType({name: orjson.dumps(schema) for name, schema in _SCHEMA_DICTS.items()})
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+_SCHEMA_ETAG = _etag(_SCHEMA_JSON)
+_SCHEMA_ETAGS = MappingProxyType({name: _etag(body) for name, body in _SCHEMAS.items()})
+
+# Schemas only change on deploy, so let clients cache briefly and then
+# revalidate with If-None-Match rather than marking them immutable
+_SCHEMA_CACHE_CONTROL = "public, max-age=3600"
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match uses weak comparison and may be "*" or a comma-separated
+    # list; proxies that compress responses often rewrite ETags to W/"..."
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+def _schema_response(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": etag, "Cache-Control": _SCHEMA_CACHE_CONTROL}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
 @app.get("/schema")
-async def get_schema():
-    return {
-        "tenant": Tenant.model_json_schema(),
-        "user": User.model_json_schema(),
-        "teacher": Teacher.model_json_schema(),
-        "parent": Parent.model_json_schema(),
-        "student": Student.model_json_schema(),
-        "class": Class.model_json_schema(),
-        "enrollment": Enrollment.model_json_schema(),
-        "attendance": Attendance.model_json_schema(),
-        "graderecord": GradeRecord.model_json_schema(),
-        "invoice": Invoice.model_json_schema(),
-        "payment": Payment.model_json_schema(),
-        "announcement": Announcement.model_json_schema(),
-        "notification": Notification.model_json_schema(),
-        "resource": Resource.model_json_schema(),
-        "assignment": Assignment.model_json_schema(),
-        "quiz": Quiz.model_json_schema(),
-        "quizsubmission": QuizSubmission.model_json_schema(),
-        "activitylog": ActivityLog.model_json_schema(),
-    }
+async def get_schema(if_none_match: Annotated[Optional[str], Header()] = None):
+    return _schema_response(_SCHEMA_JSON, _SCHEMA_ETAG, if_none_match)
+
+@app.get("/schema/{name}")
+async def get_model_schema(name: str, if_none_match: Annotated[Optional[str], Header()] = None):
+    body = _SCHEMAS.get(name)
+    if body is None:
+        raise HTTPException(status_code=404, detail=f"Unknown schema '{name}'")
+    return _schema_response(body, _SCHEMA_ETAGS[name], if_none_match)
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", min(os.cpu_count() or 1, 4)))
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        log_level=os.getenv("LOG_LEVEL", "warning"),
+        access_log=False,
+    )
@@ -6,14 +6,23 @@ Collection name = lowercase of class name (e.g., Tenant -> "tenant").
 
 These schemas are also exposed via GET /schema for tooling/validation.
 """
-from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, StringConstraints
+from typing import Annotated, Optional, List, Dict, Any
 from datetime import date, datetime
 
+# References to other documents hold str(ObjectId); the list endpoints filter
+# on the same pattern, so anything else could be stored but never queried
+OBJECT_ID_PATTERN = r"^[a-f0-9]{24}$"
+ObjectIdStr = Annotated[str, StringConstraints(pattern=OBJECT_ID_PATTERN)]
+
+class _Schema(BaseModel):
+    """Base for all collection schemas: immutable DTOs, unknown fields dropped"""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False, frozen=True)
+
 # -----------------------------------------------------------------------------
 # MULTI-TENANCY
 # -----------------------------------------------------------------------------
-class Tenant(BaseModel):
+class Tenant(_Schema):
     name: str = Field(..., description="Institution name")
     code: str = Field(..., description="Unique short code for the institution")
     address: Optional[str] = Field(None, description="Institution address")
@@ -22,36 +31,36 @@ class Tenant(BaseModel):
     timezone: Optional[str] = Field("UTC", description="Institution timezone")
     status: str = Field("active", description="active | suspended | archived")
 
+class _TenantScoped(_Schema):
+    """Base for every collection that belongs to a tenant"""
+    tenant_id: ObjectIdStr = Field(..., description="Related tenant (institution)")
+
 # -----------------------------------------------------------------------------
 # USERS & ROLES
 # -----------------------------------------------------------------------------
-class User(BaseModel):
-    tenant_id: str = Field(..., description="Related tenant (institution)")
+class User(_TenantScoped):
     name: str
     email: EmailStr
     role: str = Field(..., description="admin | teacher | student | parent | district_admin")
     password_hash: Optional[str] = Field(None, description="Hash only; never store plain text")
     is_active: bool = True
 
-class Teacher(BaseModel):
-    tenant_id: str
-    user_id: Optional[str] = Field(None, description="User account ID if linked")
+class Teacher(_TenantScoped):
+    user_id: Optional[ObjectIdStr] = Field(None, description="User account ID if linked")
     employee_id: Optional[str] = None
     subjects: List[str] = []
     hire_date: Optional[date] = None
     status: str = "active"
 
-class Parent(BaseModel):
-    tenant_id: str
-    user_id: Optional[str] = None
-    children_ids: List[str] = []
+class Parent(_TenantScoped):
+    user_id: Optional[ObjectIdStr] = None
+    children_ids: List[ObjectIdStr] = []
 
 # -----------------------------------------------------------------------------
 # STUDENTS & ACADEMICS
 # -----------------------------------------------------------------------------
-class Student(BaseModel):
-    tenant_id: str
-    user_id: Optional[str] = None
+class Student(_TenantScoped):
+    user_id: Optional[ObjectIdStr] = None
     student_number: str
     first_name: str
     last_name: str
@@ -61,34 +70,30 @@ class Student(BaseModel):
     address: Optional[str] = None
     status: str = "active"
 
-class Class(BaseModel):
-    tenant_id: str
+class Class(_TenantScoped):
     name: str
     code: str
     subject: str
     grade_level: str
-    teacher_id: Optional[str] = None
+    teacher_id: Optional[ObjectIdStr] = None
     schedule: Dict[str, Any] = Field(default_factory=dict, description="Timetable/schedule data")
 
-class Enrollment(BaseModel):
-    tenant_id: str
-    class_id: str
-    student_id: str
+class Enrollment(_TenantScoped):
+    class_id: ObjectIdStr
+    student_id: ObjectIdStr
     enrollment_date: Optional[date] = None
     status: str = "enrolled"
 
-class Attendance(BaseModel):
-    tenant_id: str
-    class_id: str
-    student_id: str
+class Attendance(_TenantScoped):
+    class_id: ObjectIdStr
+    student_id: ObjectIdStr
     date: date
     status: str = Field(..., description="present | absent | late | excused")
     method: Optional[str] = Field(None, description="manual | biometric | rfid")
 
-class GradeRecord(BaseModel):
-    tenant_id: str
-    student_id: str
-    class_id: str
+class GradeRecord(_TenantScoped):
+    student_id: ObjectIdStr
+    class_id: ObjectIdStr
     term: str
     scores: Dict[str, float] = Field(default_factory=dict, description="e.g., { 'midterm': 88, 'final': 92 }")
     remarks: Optional[str] = None
@@ -96,18 +101,16 @@ class GradeRecord(BaseModel):
 # -----------------------------------------------------------------------------
 # FINANCE
 # -----------------------------------------------------------------------------
-class Invoice(BaseModel):
-    tenant_id: str
-    student_id: str
+class Invoice(_TenantScoped):
+    student_id: ObjectIdStr
     title: str
     amount: float
     due_date: Optional[date] = None
     status: str = Field("unpaid", description="unpaid | paid | overdue | cancelled")
     meta: Dict[str, Any] = Field(default_factory=dict)
 
-class Payment(BaseModel):
-    tenant_id: str
-    invoice_id: str
+class Payment(_TenantScoped):
+    invoice_id: ObjectIdStr
     method: str = Field(..., description="stripe | upi | card | netbanking | paypal | cash")
     amount: float
     reference: Optional[str] = None
@@ -116,17 +119,15 @@ class Payment(BaseModel):
 # -----------------------------------------------------------------------------
 # COMMUNICATION
 # -----------------------------------------------------------------------------
-class Announcement(BaseModel):
-    tenant_id: str
+class Announcement(_TenantScoped):
     title: str
     message: str
     audience: List[str] = Field(default_factory=lambda: ["students", "teachers", "parents"])  # segments
     starts_at: Optional[datetime] = None
     ends_at: Optional[datetime] = None
 
-class Notification(BaseModel):
-    tenant_id: str
-    user_id: str
+class Notification(_TenantScoped):
+    user_id: ObjectIdStr
     title: str
     message: str
     type: str = Field("info", description="info | success | warning | error")
@@ -135,8 +136,7 @@ class Notification(BaseModel):
 # -----------------------------------------------------------------------------
 # CURRICULUM, ASSIGNMENTS & ASSESSMENTS
 # -----------------------------------------------------------------------------
-class Resource(BaseModel):
-    tenant_id: str
+class Resource(_TenantScoped):
     title: str
     subject: str
     grade_level: str
@@ -144,33 +144,29 @@ class Resource(BaseModel):
     url: Optional[str] = None
     tags: List[str] = []
 
-class Assignment(BaseModel):
-    tenant_id: str
-    class_id: str
+class Assignment(_TenantScoped):
+    class_id: ObjectIdStr
     title: str
     description: Optional[str] = None
     due_date: Optional[datetime] = None
 
-class Quiz(BaseModel):
-    tenant_id: str
-    class_id: str
+class Quiz(_TenantScoped):
+    class_id: ObjectIdStr
     title: str
     questions: List[Dict[str, Any]] = Field(default_factory=list, description="Array of questions with options/answers")
 
-class QuizSubmission(BaseModel):
-    tenant_id: str
-    quiz_id: str
-    student_id: str
+class QuizSubmission(_TenantScoped):
+    quiz_id: ObjectIdStr
+    student_id: ObjectIdStr
     answers: List[Any] = []
     score: Optional[float] = None
 
 # -----------------------------------------------------------------------------
 # ANALYTICS TRACKING (BASIC)
 # -----------------------------------------------------------------------------
-class ActivityLog(BaseModel):
-    tenant_id: str
-    user_id: Optional[str] = None
+class ActivityLog(_TenantScoped):
+    user_id: Optional[ObjectIdStr] = None
     action: str
     entity: str
-    entity_id: Optional[str] = None
+    entity_id: Optional[ObjectIdStr] = None
     meta: Dict[str, Any] = Field(default_factory=dict)
@@ -0,0 +1,84 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+import bson
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+from pymongo.results import InsertManyResult
+
+import database
+from database import _to_document, create_documents
+from schemas import Attendance
+
+TENANT_ID = "6540f1c2a1b2c3d4e5f60718"
+
+
+class FakeCollection:
+    """Mimics insert_many: assigns _id client-side, then fails fail_indexes"""
+
+    def __init__(self, fail_indexes=()):
+        self.fail_indexes = fail_indexes
+
+    async def insert_many(self, docs, ordered=True):
+        self.docs = docs
+        for doc in docs:
+            doc.setdefault("_id", ObjectId())
+        if self.fail_indexes:
+            raise BulkWriteError({
+                "writeErrors": [
+                    {"index": i, "code": 11000, "errmsg": "E11000 duplicate key error", "op": docs[i]}
+                    for i in self.fail_indexes
+                ],
+                "nInserted": len(docs) - len(self.fail_indexes),
+            })
+        return InsertManyResult([doc["_id"] for doc in docs], True)
+
+
+class FakeDatabase(dict):
+    def __missing__(self, name):
+        return self.setdefault(name, FakeCollection())
+
+
+def test_attendance_document_is_bson_encodable():
+    now = datetime.now(timezone.utc)
+    payload = Attendance(
+        tenant_id=TENANT_ID,
+        class_id="6540f1c2a1b2c3d4e5f60719",
+        student_id="6540f1c2a1b2c3d4e5f6071a",
+        date=date(2024, 9, 2),
+        status="present",
+    )
+
+    doc = _to_document(payload, now)
+    decoded = bson.decode(bson.encode(doc))
+
+    assert decoded["date"] == "2024-09-02"
+    assert decoded["status"] == "present"
+    assert "method" not in decoded
+    assert decoded["created_at"] == decoded["updated_at"]
+
+
+def test_create_documents_returns_all_ids(monkeypatch):
+    monkeypatch.setattr(database, "db", FakeDatabase())
+
+    ids, errors = asyncio.run(create_documents("activitylog", [{"n": i} for i in range(3)]))
+
+    assert len(ids) == 3
+    assert errors == []
+
+
+def test_create_documents_reports_partial_failure(monkeypatch):
+    collection = FakeCollection(fail_indexes=(1,))
+    monkeypatch.setattr(database, "db", FakeDatabase(activitylog=collection))
+    items = [{"n": i} for i in range(3)]
+
+    ids, errors = asyncio.run(create_documents("activitylog", items))
+
+    assert ids == [str(collection.docs[0]["_id"]), str(collection.docs[2]["_id"])]
+    assert errors == [{"index": 1, "code": 11000, "errmsg": "E11000 duplicate key error"}]
+
+
+def test_create_documents_empty_batch_skips_insert(monkeypatch):
+    monkeypatch.setattr(database, "db", FakeDatabase())
+
+    assert asyncio.run(create_documents("activitylog", [])) == ([], [])
@@ -0,0 +1,71 @@
+from fastapi.testclient import TestClient
+
+import database
+import main
+from database import MAX_DOCUMENTS
+from tests.test_database import FakeCollection, FakeDatabase, TENANT_ID
+
+client = TestClient(main.app)
+
+ACTIVITY = {"tenant_id": TENANT_ID, "action": "login", "entity": "user"}
+
+
+def test_bulk_insert_partial_failure_returns_207(monkeypatch):
+    monkeypatch.setattr(database, "db", FakeDatabase(activitylog=FakeCollection(fail_indexes=(0, 2))))
+
+    resp = client.post("/activity/bulk", json=[ACTIVITY] * 3)
+
+    assert resp.status_code == 207
+    body = resp.json()
+    assert len(body["ids"]) == 1
+    assert [err["index"] for err in body["errors"]] == [0, 2]
+
+
+def test_bulk_insert_success(monkeypatch):
+    monkeypatch.setattr(database, "db", FakeDatabase())
+
+    resp = client.post("/activity/bulk", json=[ACTIVITY] * 3)
+
+    assert resp.status_code == 200
+    assert len(resp.json()["ids"]) == 3
+    assert resp.json()["errors"] == []
+
+
+def test_bulk_insert_rejects_oversized_batch(monkeypatch):
+    monkeypatch.setattr(database, "db", FakeDatabase())
+
+    resp = client.post("/activity/bulk", json=[ACTIVITY] * (MAX_DOCUMENTS + 1))
+
+    assert resp.status_code == 422
+
+
+def test_etag_matches_weak_list_and_wildcard():
+    assert main._etag_matches('W/"x"', '"x"')
+    assert main._etag_matches('"a", "x"', '"x"')
+    assert main._etag_matches("*", '"x"')
+    assert not main._etag_matches('"a", W/"b"', '"x"')
+    assert not main._etag_matches(None, '"x"')
+
+
+def test_schema_by_name_revalidates_with_etag():
+    resp = client.get("/schema/attendance")
+    assert resp.status_code == 200
+    assert resp.json()["title"] == "Attendance"
+    etag = resp.headers["etag"]
+
+    assert client.get("/schema/attendance", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/schema/attendance", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert client.get("/schema/attendance", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_schema_by_unknown_name_is_404():
+    assert client.get("/schema/nope").status_code == 404
+
+
+def test_projection_strips_and_drops_empty_segments():
+    assert main.projection("name, email") == ["name", "email"]
+    assert main.projection("a, ,b") == ["a", "b"]
+    assert main.projection("name,") == ["name"]
+    assert main.projection(",") is None
+    assert main.projection("") is None
+    assert main.projection(None) is None